@@ -6,73 +6,215 @@ Handles complex environments including WSL, MinGW, Git Bash, and various termina
 
 import os
 import sys
-import platform
-import subprocess
-import shutil
-import locale
-import re
+import json
+import hashlib
+from functools import cached_property
+from itertools import product
 from pathlib import Path
 
+# Environment variables read during detection; they are snapshotted once per
+# run and a change in any of them invalidates the on-disk detection cache
+WATCH_VARS = (
+    "SHELL", "MSYSTEM", "PATH", "CYGWIN", "EXEPATH",
+    "LANG", "LC_ALL", "LC_CTYPE",
+    "TERM_PROGRAM", "TERMINAL_EMULATOR", "WT_SESSION", "ConEmu",
+    "WSL_DISTRO_NAME", "WSL_INTEROP", "PSModulePath",
+)
+
+# How long a positive Rust check from the WSL-from-Windows fallback is trusted
+RUST_CACHE_TTL = 24 * 60 * 60
+
+# Maps get_summary() labels to EnvironmentDetector attributes
+SUMMARY_FIELDS = (
+    ("OS", "os_type"),
+    ("WSL", "is_wsl"),
+    ("MinGW/MSYS2", "is_mingw"),
+    ("Git Bash", "is_git_bash"),
+    ("Cygwin", "is_cygwin"),
+    ("Terminal", "terminal_type"),
+    ("Emoji Support", "supports_emoji"),
+    ("Python Type", "python_type"),
+    ("Shell", "actual_shell"),
+)
+
+_BOOLS = (False, True)
+
+# Shell to use, keyed by (WSL with Windows Python, MinGW/Git Bash/Cygwin,
+# native Windows, PowerShell available); earlier flags take precedence.
+# Keys missing from the table are Unix-like and fall back to $SHELL.
+_SHELL_TABLE = {
+    # WSL accessed from Windows Python needs special handling
+    **{(True, posix, win, ps): "wsl_from_windows" for posix, win, ps in product(_BOOLS, repeat=3)},
+    # MinGW/Git Bash/Cygwin should always use bash
+    **{(False, True, win, ps): "bash" for win, ps in product(_BOOLS, repeat=2)},
+    # Native Windows
+    (False, False, True, True): "powershell",
+    (False, False, True, False): "cmd",
+}
+
+_UNIX_SHELLS = ("bash", "zsh", "fish")
+
+def _shell_from_env(shell_env):
+    """Pick a Unix shell from $SHELL, defaulting to bash"""
+    shell_env = shell_env.lower()
+    for shell in _UNIX_SHELLS:
+        if shell in shell_env:
+            return shell
+    return "bash"
+
+def _snapshot_env():
+    """Read every watched environment variable exactly once (unset ones are omitted)"""
+    environ = os.environ
+    return {k: environ[k] for k in WATCH_VARS if k in environ}
+
+def _env_cache_key(env):
+    """Hash the environment snapshot and interpreter that detection depends on"""
+    state = repr((sys.executable, sorted(env.items())))
+    return hashlib.blake2b(state.encode()).hexdigest()
+
+def _cache_file():
+    """Locate the cache file, or None when there is no home directory to put it in"""
+    cache_home = os.environ.get("XDG_CACHE_HOME")
+    if not cache_home:
+        try:
+            cache_home = Path.home() / ".cache"
+        except (RuntimeError, KeyError):
+            return None
+    return Path(cache_home) / "cli_tooling" / "env.json"
+
+def _read_cache():
+    """Read the cache file, returning an empty dict if it is missing or corrupt"""
+    cache_file = _cache_file()
+    if cache_file is None:
+        return {}
+    try:
+        with open(cache_file, "r", encoding="utf-8") as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cached if isinstance(cached, dict) else {}
+
+def _update_cache(**fields):
+    """Atomically merge fields into the cache file"""
+    cache_file = _cache_file()
+    if cache_file is None:
+        return
+    data = _read_cache()
+    data.update(fields)
+    tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        try:
+            os.unlink(tmp_file)
+        except OSError:
+            pass
+
+def _load_cached_env(key):
+    """Load cached detection results, or None if missing or stale"""
+    cached = _read_cache()
+    if cached.get("key") != key:
+        return None
+    summary = cached.get("summary")
+    return summary if isinstance(summary, dict) else None
+
+def _save_cached_env(key, summary):
+    """Write detection results to the cache file"""
+    _update_cache(key=key, summary=summary)
+
 class EnvironmentDetector:
     """Comprehensive environment detection for cross-platform compatibility"""
     
-    def __init__(self):
-        self.os_type = platform.system().lower()
-        self.is_wsl = self._detect_wsl()
-        self.is_mingw = self._detect_mingw()
-        self.is_cygwin = self._detect_cygwin()
-        self.is_git_bash = self._detect_git_bash()
-        self.terminal_type = self._detect_terminal()
-        self.supports_emoji = self._detect_emoji_support()
-        self.python_type = self._detect_python_type()
-        self.actual_shell = self._detect_actual_shell()
+    def __init__(self, use_cache=True):
+        self._env = env = _snapshot_env()
+        self._msystem = env.get("MSYSTEM", "")
+        
+        # Reuse previous results when the relevant environment is unchanged
+        key = _env_cache_key(env)
+        cached = _load_cached_env(key) if use_cache else None
+        if cached is not None and all(label in cached for label, _ in SUMMARY_FIELDS):
+            for label, attr in SUMMARY_FIELDS:
+                setattr(self, attr, cached[label])
+            return
+        
+        self._path_lower = env.get("PATH", "").lower()
         
-    def _detect_wsl(self):
+        # Evaluating the summary resolves (and memoizes) every property
+        _save_cached_env(key, self.get_summary())
+    
+    @cached_property
+    def os_type(self):
+        """Detect the operating system"""
+        # sys.platform is fixed at interpreter build time, so no uname() call is needed
+        if sys.platform == "win32":
+            return "windows"
+        if sys.platform.startswith("linux"):
+            return "linux"
+        return sys.platform
+    
+    @cached_property
+    def is_wsl(self):
         """Detect if running in WSL"""
-        # Check for WSL-specific files and environment
-        if os.path.exists("/proc/version"):
+        # WSL interop registration and runtime directory are the most reliable signals
+        if os.path.exists("/proc/sys/fs/binfmt_misc/WSLInterop") or os.path.isdir("/run/WSL"):
+            return True
+        
+        # Fall back to the kernel version string ("Microsoft" on WSL1, "microsoft" on WSL2)
+        try:
+            fd = os.open("/proc/version", os.O_RDONLY)
             try:
-                with open("/proc/version", "r") as f:
-                    return "microsoft" in f.read().lower()
-            except:
-                pass
-        return "WSL_DISTRO_NAME" in os.environ or "WSL_INTEROP" in os.environ
+                buf = os.read(fd, 256)
+            finally:
+                os.close(fd)
+        except OSError:
+            pass
+        else:
+            return b"icrosoft" in buf or b"ICROSOFT" in buf
+        return "WSL_DISTRO_NAME" in self._env or "WSL_INTEROP" in self._env
     
-    def _detect_mingw(self):
+    @cached_property
+    def is_mingw(self):
         """Detect if running in MinGW/MSYS2"""
         return (
-            "MSYSTEM" in os.environ or 
-            "MINGW" in os.environ.get("MSYSTEM", "") or
-            "/mingw" in os.environ.get("PATH", "").lower()
+            "MSYSTEM" in self._env or 
+            "MINGW" in self._msystem or
+            "/mingw" in self._path_lower
         )
     
-    def _detect_cygwin(self):
+    @cached_property
+    def is_cygwin(self):
         """Detect if running in Cygwin"""
         return (
-            "CYGWIN" in os.environ or 
+            "CYGWIN" in self._env or 
             os.path.exists("/cygdrive") or
             "/cygwin" in sys.executable.lower()
         )
     
-    def _detect_git_bash(self):
+    @cached_property
+    def is_git_bash(self):
         """Detect if running in Git Bash"""
         return (
-            "MINGW" in os.environ.get("MSYSTEM", "") and 
-            "Git" in os.environ.get("EXEPATH", "")
+            "MINGW" in self._msystem and 
+            "Git" in self._env.get("EXEPATH", "")
         )
     
-    def _detect_terminal(self):
+    @cached_property
+    def terminal_type(self):
         """Detect terminal emulator type"""
         # Check various terminal environment variables
-        term_program = os.environ.get("TERM_PROGRAM", "")
-        terminal_emulator = os.environ.get("TERMINAL_EMULATOR", "")
-        wt_session = os.environ.get("WT_SESSION", "")
+        env = self._env
+        term_program = env.get("TERM_PROGRAM", "")
+        terminal_emulator = env.get("TERMINAL_EMULATOR", "")
+        wt_session = env.get("WT_SESSION", "")
         
         if "vscode" in term_program.lower():
             return "vscode"
         elif wt_session:
             return "windows_terminal"
-        elif "ConEmu" in os.environ:
+        elif "ConEmu" in env:
             return "conemu"
         elif terminal_emulator:
             return terminal_emulator.lower()
@@ -81,253 +223,286 @@ class EnvironmentDetector:
         else:
             return "unknown"
     
-    def _detect_emoji_support(self):
+    @cached_property
+    def supports_emoji(self):
         """Detect if terminal supports emoji"""
         # Windows Terminal and VSCode generally support emoji
         if self.terminal_type in ["windows_terminal", "vscode"]:
             return True
         
-        # Check locale for UTF-8 support
-        try:
-            current_locale = locale.getlocale()[1]
-            if current_locale and "utf" in current_locale.lower():
-                return True
-        except:
-            pass
+        # Check the effective locale for UTF-8 support without importing
+        # locale; LC_ALL overrides LC_CTYPE, which overrides LANG
+        env = self._env
+        ctype = (env.get("LC_ALL") or env.get("LC_CTYPE") or env.get("LANG", "")).lower()
+        if "utf-8" in ctype or "utf8" in ctype:
+            return True
         
         # Check LANG environment variable
-        lang = os.environ.get("LANG", "")
+        lang = env.get("LANG", "")
         if "UTF-8" in lang or "utf8" in lang.lower():
             return True
         
         # Conservative default
         return False
     
-    def _detect_python_type(self):
+    @cached_property
+    def python_type(self):
         """Detect if Python is Windows native or WSL/Unix"""
-        # Check if Python executable is Windows-style
-        if "\\" in sys.executable or re.match(r"^[A-Za-z]:", sys.executable):
+        # Check if Python executable is Windows-style (backslashes or a drive letter)
+        exe = sys.executable
+        if "\\" in exe or (len(exe) >= 2 and exe[1] == ":" and exe[0].isalpha()):
             return "windows"
         else:
             return "unix"
     
-    def _detect_actual_shell(self):
+    @cached_property
+    def actual_shell(self):
         """Detect the actual shell to use based on environment"""
-        # If we're in WSL but Python is Windows, we need special handling
-        if self.is_wsl and self.python_type == "windows":
-            return "wsl_from_windows"
-        
-        # MinGW/Git Bash should always use bash
-        if self.is_mingw or self.is_git_bash or self.is_cygwin:
-            return "bash"
-        
-        # Native Windows
-        if self.os_type == "windows" and not (self.is_wsl or self.is_mingw or self.is_cygwin):
-            if "PSModulePath" in os.environ:
-                return "powershell"
-            else:
-                return "cmd"
-        
-        # Unix-like systems
-        shell_env = os.environ.get("SHELL", "").lower()
-        if "bash" in shell_env:
-            return "bash"
-        elif "zsh" in shell_env:
-            return "zsh"
-        elif "fish" in shell_env:
-            return "fish"
-        else:
-            return "bash"  # Default for Unix
+        key = (
+            self.is_wsl and self.python_type == "windows",
+            self.is_mingw or self.is_git_bash or self.is_cygwin,
+            self.os_type == "windows" and not self.is_wsl,
+            "PSModulePath" in self._env,
+        )
+        return _SHELL_TABLE.get(key) or _shell_from_env(self._env.get("SHELL", ""))
+    
+    @property
+    def wsl_distro(self):
+        """Name of the WSL distro we are running in, or "" outside WSL"""
+        return self._env.get("WSL_DISTRO_NAME", "")
     
     def get_summary(self):
         """Get a summary of detected environment"""
-        return {
-            "OS": self.os_type,
-            "WSL": self.is_wsl,
-            "MinGW/MSYS2": self.is_mingw,
-            "Git Bash": self.is_git_bash,
-            "Cygwin": self.is_cygwin,
-            "Terminal": self.terminal_type,
-            "Emoji Support": self.supports_emoji,
-            "Python Type": self.python_type,
-            "Shell": self.actual_shell
-        }
-
-def check_rust_installed():
-    """Check if Rust is installed"""
+        return {label: getattr(self, attr) for label, attr in SUMMARY_FIELDS}
+
+def _wsl_rustc_paths(distro):
+    """Candidate rustc locations inside the WSL distro, as seen from Windows"""
+    if not distro:
+        return
+    share = rf"\\wsl$\{distro}"
+    yield rf"{share}\root\.cargo\bin\rustc"
+    
+    # USER/USERNAME on Windows Python is the Windows account, which need not
+    # match the distro's default Linux user, so probe every home directory
     try:
-        # Try to run rustc in various ways
-        commands = [
-            ["rustc", "--version"],
-            ["cargo", "--version"]
-        ]
+        with os.scandir(rf"{share}\home") as homes:
+            for home in homes:
+                yield rf"{home.path}\.cargo\bin\rustc"
+    except OSError:
+        pass
+
+def check_rust_installed(env_detector, use_cache=True):
+    """Check if Rust is installed"""
+    import shutil
+    
+    # A PATH lookup is enough to tell whether the toolchain is available
+    if shutil.which("rustc") is not None or shutil.which("cargo") is not None:
+        return True
+    
+    # If in WSL with Windows Python, look for rustc through the \\wsl$ share
+    # first, and only start the WSL VM when that is inconclusive
+    if env_detector.is_wsl and env_detector.python_type == "windows":
+        import time
         
-        for cmd in commands:
-            try:
-                result = subprocess.run(cmd, 
-                                      stdout=subprocess.PIPE, 
-                                      stderr=subprocess.PIPE, 
-                                      text=True,
-                                      timeout=5)
-                if result.returncode == 0:
-                    return True
-            except:
-                continue
+        distro = env_detector.wsl_distro
+        
+        # Trust a recent positive result for the same distro
+        if use_cache:
+            cached = _read_cache().get("rust")
+            if (isinstance(cached, dict) and cached.get("rustc_ok")
+                    and cached.get("distro") == distro
+                    and isinstance(cached.get("checked_at"), (int, float))
+                    and time.time() - cached["checked_at"] < RUST_CACHE_TTL):
+                return True
         
-        # If in WSL with Windows Python, try WSL command
-        env = EnvironmentDetector()
-        if env.is_wsl and env.python_type == "windows":
+        found = any(os.path.exists(path) for path in _wsl_rustc_paths(distro))
+        if not found and shutil.which("wsl"):
+            import subprocess
             try:
-                result = subprocess.run(["wsl", "rustc", "--version"],
-                                      stdout=subprocess.PIPE,
-                                      stderr=subprocess.PIPE,
+                result = subprocess.run(["wsl", "which", "rustc"],
+                                      stdout=subprocess.DEVNULL,
+                                      stderr=subprocess.DEVNULL,
                                       timeout=5)
-                return result.returncode == 0
-            except:
+                found = result.returncode == 0
+            except (OSError, subprocess.SubprocessError):
                 pass
         
-        return False
-    except:
-        return False
+        if found:
+            _update_cache(rust={"distro": distro, "rustc_ok": True, "checked_at": time.time()})
+        return found
+    
+    return False
 
 def get_script_directory():
     """Get the directory where this script is located"""
     return Path(__file__).parent.absolute()
 
-def run_installer(env_detector, args):
-    """Run the appropriate installer based on detected environment"""
-    script_dir = get_script_directory()
+# Installer script locations never change after install, so resolve them once
+_SCRIPT_DIR = get_script_directory()
+_BASH_SH = os.fspath(_SCRIPT_DIR / "install.sh")
+_PS1 = os.fspath(_SCRIPT_DIR / "install.ps1")
+_BASH_EXISTS = os.path.isfile(_BASH_SH)
+_PS1_EXISTS = os.path.isfile(_PS1)
+
+def _launch(command, replace_process=False):
+    """Run an installer command, replacing this process with it when requested"""
+    # Windows has no real exec; the parent would return to the console early
+    if replace_process and os.name != "nt":
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os.execvp(command[0], command)
     
-    # Handle special case: WSL accessed from Windows Python
-    if env_detector.actual_shell == "wsl_from_windows":
-        bash_script = script_dir / "install.sh"
-        if not bash_script.exists():
-            print("Error: install.sh not found")
-            return 1
-        
-        # Convert Windows path to WSL path
-        wsl_path = subprocess.run(["wsl", "wslpath", str(bash_script)],
-                                 capture_output=True, text=True).stdout.strip()
-        
-        # Build WSL command
-        wsl_command = ["wsl", "bash", wsl_path]
-        wsl_command.extend(args)
-        
-        # Pass emoji support as environment variable
-        env = os.environ.copy()
-        env["INSTALLER_EMOJI_SUPPORT"] = "1" if env_detector.supports_emoji else "0"
-        
-        return subprocess.call(wsl_command, env=env)
+    import subprocess
+    return subprocess.call(command)
+
+def _default_wsl_path(path):
+    """Translate a drive-letter path using WSL's default /mnt automount layout"""
+    if len(path) >= 2 and path[1] == ":" and path[0].isalpha():
+        return "/mnt/" + path[0].lower() + path[2:].replace("\\", "/")
+    return ""
+
+def _wsl_script_path(script, use_cache=True):
+    """Convert a Windows path to the path WSL sees, reusing a cached translation"""
+    try:
+        mtime = os.stat(script).st_mtime
+    except OSError:
+        mtime = None
     
-    # Handle MinGW/Git Bash/Cygwin - always use bash
-    elif env_detector.is_mingw or env_detector.is_git_bash or env_detector.is_cygwin:
-        bash_script = script_dir / "install.sh"
-        if not bash_script.exists():
-            print("Error: install.sh not found")
-            return 1
-        
-        # Make sure script is executable
+    cached = _read_cache().get("wsl_bash_path") if use_cache else None
+    if (isinstance(cached, dict) and cached.get("script") == script
+            and cached.get("mtime") == mtime and cached.get("path")):
+        return cached["path"]
+    
+    # wslpath prints a single line, so decode the raw bytes once instead of
+    # going through text-mode pipes
+    import subprocess
+    try:
+        result = subprocess.run(["wsl", "wslpath", script], stdout=subprocess.PIPE,
+                                stderr=subprocess.DEVNULL, check=False)
+    except OSError:
+        result = None
+    if result is None or result.returncode != 0:
+        # Guess the default layout, but don't cache a guess
+        return _default_wsl_path(script)
+    
+    wsl_path = result.stdout.decode("utf-8", "replace").rstrip("\r\n")
+    if wsl_path:
+        _update_cache(wsl_bash_path={"script": script, "mtime": mtime, "path": wsl_path})
+    return wsl_path or _default_wsl_path(script)
+
+def _local_script_path(script, _use_cache=True):
+    """Make sure a local bash script is executable before running it"""
+    # Skip the chmod (and its ctime update) when the script is already executable
+    if not os.access(script, os.X_OK):
         try:
-            os.chmod(bash_script, 0o755)
-        except:
+            os.chmod(script, 0o755)
+        except OSError:
             pass
-        
-        # Use bash directly
-        bash_command = ["bash", str(bash_script)]
-        bash_command.extend(args)
-        
-        # Pass emoji support as environment variable
-        env = os.environ.copy()
-        env["INSTALLER_EMOJI_SUPPORT"] = "1" if env_detector.supports_emoji else "0"
-        
-        return subprocess.call(bash_command, env=env)
+    return script
+
+# Installer invocation keyed by actual_shell:
+# (interpreter command, script, script exists, script path fixup, no-emoji args)
+_BASH_RUNNER = (["bash"], _BASH_SH, _BASH_EXISTS, _local_script_path, ())
+_PS_RUNNER = (["powershell", "-ExecutionPolicy", "Bypass", "-File"], _PS1, _PS1_EXISTS, None, ("-NoEmoji",))
+_RUN_TABLE = {
+    "wsl_from_windows": (["wsl", "bash"], _BASH_SH, _BASH_EXISTS, _wsl_script_path, ()),
+    "bash": _BASH_RUNNER,
+    "zsh": _BASH_RUNNER,
+    "fish": _BASH_RUNNER,
+    "powershell": _PS_RUNNER,
+    "cmd": _PS_RUNNER,
+}
+
+def run_installer(env_detector, args, replace_process=False, use_cache=True):
+    """Run the appropriate installer based on detected environment
     
-    # Windows PowerShell/CMD
-    elif env_detector.actual_shell in ["powershell", "cmd"]:
-        ps_script = script_dir / "install.ps1"
-        if not ps_script.exists():
-            print("Error: install.ps1 not found")
-            return 1
-        
-        # Build PowerShell command
-        ps_command = ["powershell", "-ExecutionPolicy", "Bypass", "-File", str(ps_script)]
-        
-        # Pass emoji support as argument
-        if not env_detector.supports_emoji:
-            ps_command.append("-NoEmoji")
-        
-        ps_command.extend(args)
-        
-        return subprocess.call(ps_command)
+    With replace_process, bash installers are exec'd in place of the Python
+    interpreter instead of being run as a child process. Without use_cache,
+    cached script path translations are ignored and refreshed.
+    """
+    interpreter, script, script_exists, path_fn, no_emoji_args = _RUN_TABLE.get(
+        env_detector.actual_shell, _BASH_RUNNER
+    )
+    if not script_exists:
+        print(f"Error: {os.path.basename(script)} not found")
+        return 1
     
-    # Standard Unix/Linux
-    else:
-        bash_script = script_dir / "install.sh"
-        if not bash_script.exists():
-            print("Error: install.sh not found")
-            return 1
-        
-        # Make sure script is executable
-        os.chmod(bash_script, 0o755)
-        
-        # Build bash command
-        bash_command = ["bash", str(bash_script)]
-        bash_command.extend(args)
-        
-        # Pass emoji support as environment variable
-        env = os.environ.copy()
-        env["INSTALLER_EMOJI_SUPPORT"] = "1" if env_detector.supports_emoji else "0"
-        
-        return subprocess.call(bash_command, env=env)
+    # Pass emoji support as environment variable (and as arguments for
+    # PowerShell); we exit right after the installer, so setting it on our
+    # own environment avoids a full copy
+    os.environ["INSTALLER_EMOJI_SUPPORT"] = "1" if env_detector.supports_emoji else "0"
+    
+    command = interpreter + [path_fn(script, use_cache) if path_fn else script]
+    if not env_detector.supports_emoji:
+        command.extend(no_emoji_args)
+    command.extend(args)
+    
+    return _launch(command, replace_process)
+
+_HELP_HEADER = """\
+Universal Rust Development Tools Installer
+========================================
+
+This installer automatically detects your environment and runs
+the appropriate installation script.
+
+Usage: python install.py [options]
+Options:
+  --all            Install all tools without prompting
+  --debug          Show environment detection details
+  --no-cache       Ignore cached detection results and re-probe
+  --help, -h       Show this help message
+
+Detected environment:
+"""
+
+_RUST_MISSING = """\
+Error: Rust is not installed!
+Please install Rust first: https://rustup.rs
+"""
+_RUST_HINT_WINDOWS = "For Windows: https://win.rustup.rs\n"
+_RUST_HINT_UNIX = "Run: curl --proto '=https' --tlsv1.2 -sSf https://sh.rustup.rs | sh\n"
+
+def _format_summary(env_detector, indent=""):
+    """Format the environment summary as one "key: value" line per entry"""
+    return "".join(f"{indent}{key}: {value}\n" for key, value in env_detector.get_summary().items())
 
 def main():
     """Main entry point"""
     args = sys.argv[1:]
     
+    # Bypass cached detection results if requested
+    use_cache = "--no-cache" not in args
+    if not use_cache:
+        args.remove("--no-cache")
+    
     # Initialize environment detector
-    env_detector = EnvironmentDetector()
+    env_detector = EnvironmentDetector(use_cache=use_cache)
     
     # Show debug info if requested
     if "--debug" in args:
-        print("Environment Detection Results:")
-        print("=" * 40)
-        for key, value in env_detector.get_summary().items():
-            print(f"{key}: {value}")
-        print("=" * 40)
-        print()
+        rule = "=" * 40 + "\n"
+        sys.stdout.write(
+            "Environment Detection Results:\n" + rule
+            + _format_summary(env_detector) + rule + "\n"
+        )
         args.remove("--debug")
     
     # Show help if requested
     if "--help" in args or "-h" in args:
-        print("Universal Rust Development Tools Installer")
-        print("=" * 40)
-        print()
-        print("This installer automatically detects your environment and runs")
-        print("the appropriate installation script.")
-        print()
-        print("Usage: python install.py [options]")
-        print("Options:")
-        print("  --all            Install all tools without prompting")
-        print("  --debug          Show environment detection details")
-        print("  --help, -h       Show this help message")
-        print()
-        print("Detected environment:")
-        for key, value in env_detector.get_summary().items():
-            print(f"  {key}: {value}")
+        sys.stdout.write(_HELP_HEADER + _format_summary(env_detector, "  "))
         return 0
     
     # Quick Rust check
-    if not check_rust_installed():
-        print("Error: Rust is not installed!")
-        print("Please install Rust first: https://rustup.rs")
+    if not check_rust_installed(env_detector, use_cache=use_cache):
         if env_detector.os_type == "windows" or env_detector.python_type == "windows":
-            print("For Windows: https://win.rustup.rs")
+            sys.stdout.write(_RUST_MISSING + _RUST_HINT_WINDOWS)
         else:
-            print("Run: curl --proto '=https' --tlsv1.2 -sSf https://sh.rustup.rs | sh")
+            sys.stdout.write(_RUST_MISSING + _RUST_HINT_UNIX)
         return 1
     
     # Run appropriate installer
-    return run_installer(env_detector, args)
+    return run_installer(env_detector, args, replace_process=True, use_cache=use_cache)
 
 if __name__ == "__main__":
     sys.exit(main())
\ No newline at end of file